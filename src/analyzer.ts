@@ -71,7 +71,7 @@ export class Analyzer<ProcessCollection extends readonly Processes.Process<strin
      * @throws Error if any process input alias is not found in the datasets map.
      */
     async run(): Promise<TupleToResult<ProcessCollection>> {
-        const output: [string, unknown][] = []
+        const output: Record<string, unknown> = {}
         for (const proc of this.processes) {
             const id = proc.id
             const inputs: string[] = (proc as DSLProcess)._inputs ?? ['dataset']
@@ -98,9 +98,9 @@ export class Analyzer<ProcessCollection extends readonly Processes.Process<strin
             const result = await proc.run(ctx)
 
             this.datasets[id] = result
-            output.push([id, result])
+            output[id] = result
         }
-        return Object.fromEntries(output) as TupleToResult<ProcessCollection>
+        return output as TupleToResult<ProcessCollection>
     }
 
     /**
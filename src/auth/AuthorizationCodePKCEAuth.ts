@@ -25,6 +25,8 @@ export class AuthorizationCodePKCEAuth {
     private _accessToken?: string
     private _refreshTokenValue?: string
     private _expiresAt?: number
+    /** `Authorization` header value, built once per token rather than once per request. */
+    private _authHeader?: string
 
     get accessToken(): string | undefined {
         return this._accessToken
@@ -85,13 +87,16 @@ export class AuthorizationCodePKCEAuth {
      * Opens the system browser or prints the URL, then listens for the callback to capture the code.
      */
     private async _performAuthorization(): Promise<void> {
+        // One entropy read covers both the PKCE verifier (32 bytes) and the CSRF state (16 bytes)
+        const entropy = randomBytes(48)
+
         // Generate PKCE code verifier and challenge
-        const verifier = this._codeVerifier ?? base64URLEncode(randomBytes(32))
+        const verifier = this._codeVerifier ?? base64URLEncode(entropy.subarray(0, 32))
         this._codeVerifier = verifier
         const challenge = base64URLEncode(createHash('sha256').update(verifier).digest())
 
         // State for CSRF protection
-        const state = base64URLEncode(randomBytes(16))
+        const state = base64URLEncode(entropy.subarray(32))
 
         // Build the authorization URL
         const authUrl = new URL(this._authorizeUrl)
@@ -189,6 +194,7 @@ ${authUrl}`)
         this._accessToken = json.access_token
         this._refreshTokenValue = json.refresh_token
         this._expiresAt = nowSec + json.expires_in - 60
+        this._authHeader = `Bearer ${this._accessToken}`
     }
 
     async *authFlow(req: Request): AsyncGenerator<Request> {
@@ -196,7 +202,7 @@ ${authUrl}`)
             await this._refreshToken()
         }
         const headers = new Headers(req.headers)
-        headers.set('Authorization', `Bearer ${this._accessToken}`)
+        headers.set('Authorization', this._authHeader!)
         yield new Request(req, { headers })
     }
 
@@ -12,6 +12,9 @@ export class ClientCredentialsAuth implements Auth {
 
     private _accessToken?: string
     private _expiresAt?: number
+    private _authHeader?: string
+    /** In-flight token request, shared by concurrent callers so only one fetch is made. */
+    private _pendingRefresh?: Promise<void>
 
     get accessToken(): string | undefined {
         return this._accessToken
@@ -72,14 +75,26 @@ export class ClientCredentialsAuth implements Auth {
         const json = await response.json()
         this._accessToken = json.access_token
         this._expiresAt = nowSec + json.expires_in - 60
+        this._authHeader = `Bearer ${this._accessToken}`
+    }
+
+    /**
+     * Fetch an access token unless a valid one is already cached.
+     *
+     * Concurrent callers await the same token request rather than each starting their own.
+     */
+    async prefetchToken(): Promise<void> {
+        if (this._accessToken && this._expiresAt && Date.now() / 1000 < this._expiresAt) return
+        this._pendingRefresh ??= this._refreshToken().finally(() => {
+            this._pendingRefresh = undefined
+        })
+        await this._pendingRefresh
     }
 
     async *authFlow(req: Request): AsyncGenerator<Request> {
-        if (!this._accessToken || !this._expiresAt || Date.now() / 1000 >= this._expiresAt) {
-            await this._refreshToken()
-        }
+        await this.prefetchToken()
         const headers = new Headers(req.headers)
-        headers.set('Authorization', `Bearer ${this._accessToken}`)
+        headers.set('Authorization', this._authHeader!)
         yield new Request(req, { headers })
     }
 
@@ -0,0 +1,34 @@
+import { describe, it, expect, vi, afterEach } from 'vitest'
+import { autoCluster } from './autoCluster'
+
+// Two tight pairs of points: {0, 1} and {2, 3}
+const similarityMatrix = [
+    [1, 0.9, 0.1, 0.2],
+    [0.9, 1, 0.2, 0.1],
+    [0.1, 0.2, 1, 0.8],
+    [0.2, 0.1, 0.8, 1],
+]
+
+describe('autoCluster logging', () => {
+    afterEach(() => {
+        vi.restoreAllMocks()
+    })
+
+    it('stays silent by default', () => {
+        const debugSpy = vi.spyOn(console, 'debug').mockImplementation(() => {})
+        autoCluster(similarityMatrix, { mode: 'medoid' })
+        autoCluster(similarityMatrix, { mode: 'dbscan' })
+        expect(debugSpy).not.toHaveBeenCalled()
+    })
+
+    it('logs the parameter search when debug is true', () => {
+        const debugSpy = vi.spyOn(console, 'debug').mockImplementation(() => {})
+        autoCluster(similarityMatrix, { mode: 'medoid', debug: true })
+        expect(debugSpy).toHaveBeenCalledWith(
+            expect.stringContaining('Auto k: Searching for optimal k'),
+        )
+        debugSpy.mockClear()
+        autoCluster(similarityMatrix, { mode: 'dbscan', debug: true })
+        expect(debugSpy).toHaveBeenCalledWith(expect.stringContaining('Auto DBSCAN'))
+    })
+})
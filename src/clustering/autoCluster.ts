@@ -12,6 +12,7 @@ import type {
     HACConfig,
 } from './types'
 import { normalizeSimilarityMatrix } from './helpers'
+import { debugLog } from '../core/log'
 
 /**
  * Performs automatic clustering on a similarity matrix using the specified mode and configuration.
@@ -28,8 +29,9 @@ import { normalizeSimilarityMatrix } from './helpers'
  *   over a range of `k` values (e.g., from 2 up to `min(n-1, 9)`). The optimal `k` is chosen
  *   by maximizing the silhouette score of the resulting clustering.
  *
- * The function logs its progress for automatic parameter determination (e.g., chosen `eps` and `minPts`
- * for DBSCAN, or `k` search progress for other modes).
+ * When `config.debug` is `true`, the function logs its progress for automatic parameter determination
+ * (e.g., chosen `eps` and `minPts` for DBSCAN, or `k` search progress for other modes) via
+ * `console.debug`. It is silent by default.
  *
  * The function returns the clustering result along with key metrics: the number of clusters `k`,
  * the clustering cost, and the silhouette score.
@@ -71,6 +73,7 @@ export function autoCluster<TConfig extends AutoConfigMap[Mode]>(
     config: TConfig,
 ): ClusteringResultWithMetrics<ResultMap[TConfig['mode']]> {
     const n = similarityMatrix.length
+    const debug = config.debug ?? false
 
     // In auto-clustering, we default to normalizing the similarity matrix
     // unless explicitly disabled in the config.
@@ -82,7 +85,7 @@ export function autoCluster<TConfig extends AutoConfigMap[Mode]>(
             const minPts = config.minPts ?? Math.min(n - 1, Math.max(2, 4))
             const eps = config.eps ?? findOptimalEps(distMatrix, minPts)
 
-            console.log(`Auto DBSCAN: Using eps=${eps.toFixed(4)}, minPts=${minPts}`)
+            debugLog(debug, `Auto DBSCAN: Using eps=${eps.toFixed(4)}, minPts=${minPts}`)
             const finalConfig: DBSCANConfig = { mode: 'dbscan', eps, minPts }
             const result = cluster(distMatrix, finalConfig)
 
@@ -114,7 +117,8 @@ export function autoCluster<TConfig extends AutoConfigMap[Mode]>(
                 return withMetrics as ClusteringResultWithMetrics<ResultMap[TConfig['mode']]>
             } else {
                 const kRange = Array.from({ length: Math.min(n - 2, 8) }, (_, i) => i + 2)
-                console.log(
+                debugLog(
+                    debug,
                     `Auto k: Searching for optimal k in range [${kRange[0]}...${kRange[kRange.length - 1]}]...`,
                 )
 
@@ -123,7 +127,7 @@ export function autoCluster<TConfig extends AutoConfigMap[Mode]>(
                     const result = cluster(similarityMatrix, finalConfig)
                     const cost = calculateClusteringCost(similarityMatrix, result)
                     const silhouette = calculateSilhouetteScore(similarityMatrix, result)
-                    console.log(`  k=${k}, Silhouette=${silhouette.toFixed(4)}`)
+                    debugLog(debug, `  k=${k}, Silhouette=${silhouette.toFixed(4)}`)
                     return {
                         ...result,
                         k,
@@ -30,13 +30,25 @@ export function calculateClusterDistance(
     matrix: number[][],
     linkage: 'single' | 'complete' | 'average',
 ): number {
-    const ds = clusterA.flatMap(pA => clusterB.map(pB => matrix[pA][pB]))
+    // Fold the pairwise distances as they are read instead of collecting them first
+    let min = Infinity
+    let max = -Infinity
+    let sum = 0
+    for (const pA of clusterA) {
+        const row = matrix[pA]
+        for (const pB of clusterB) {
+            const d = row[pB]
+            if (d < min) min = d
+            if (d > max) max = d
+            sum += d
+        }
+    }
     switch (linkage) {
         case 'single':
-            return Math.min(...ds)
+            return min
         case 'complete':
-            return Math.max(...ds)
+            return max
         default:
-            return ds.reduce((s, d) => s + d, 0) / ds.length
+            return sum / (clusterA.length * clusterB.length)
     }
 }
@@ -38,18 +38,25 @@
  *     no differences in similarity.
  */
 export function normalizeSimilarityMatrix(matrix: number[][], skip: boolean = false): number[][] {
-    // Determine if values fall outside the standard [0, 1] range
-    const needsNormalization = matrix.some(row => row.some(val => val < 0 || val > 1))
+    if (skip) {
+        return matrix.map(row => row.map(sim => 1 - sim))
+    }
+
+    // Find the min and max in one pass over the rows, without flattening the matrix
+    let originalMin = Infinity
+    let originalMax = -Infinity
+    for (const row of matrix) {
+        for (const val of row) {
+            if (val < originalMin) originalMin = val
+            if (val > originalMax) originalMax = val
+        }
+    }
 
-    // If skipping normalization or all values already in [0,1], use simple inversion
-    if (skip || !needsNormalization) {
+    // If all values already fall in the standard [0, 1] range, use simple inversion
+    if (originalMin >= 0 && originalMax <= 1) {
         return matrix.map(row => row.map(sim => 1 - sim))
     }
 
-    // Compute the min and max values in the entire matrix
-    const flat = matrix.flat()
-    const originalMin = Math.min(...flat)
-    const originalMax = Math.max(...flat)
     const range = originalMax - originalMin
 
     // If there is no range, all distances are zero
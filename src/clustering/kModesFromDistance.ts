@@ -56,8 +56,9 @@ export function kModesFromDistance(matrix: number[][], config: KModesConfig): KM
     let changed = true
 
     while (iterations < maxIterations && changed) {
-        // Assignment step: assign to nearest medoid (min distance)
+        // Assignment step: assign to nearest medoid (min distance), noting any change
         const newAssignments = new Array(n).fill(-1)
+        changed = false
         for (let i = 0; i < n; i++) {
             let bestCluster = -1
             let minDist = Infinity
@@ -69,18 +70,19 @@ export function kModesFromDistance(matrix: number[][], config: KModesConfig): KM
                 }
             }
             newAssignments[i] = bestCluster
+            if (bestCluster !== assignments[i]) changed = true
         }
-
-        // Check for changes
-        changed = JSON.stringify(assignments) !== JSON.stringify(newAssignments)
         assignments = newAssignments
 
         // Update step: compute new medoids by minimizing total distance
+        const clusterMembers: number[][] = Array.from({ length: k }, () => [])
+        for (let i = 0; i < n; i++) {
+            // A point with no finite distance to any medoid stays unassigned (-1)
+            if (assignments[i] >= 0) clusterMembers[assignments[i]].push(i)
+        }
         const newCenters: number[] = []
         for (let c = 0; c < k; c++) {
-            const members = assignments
-                .map((clusterIdx, idx) => (clusterIdx === c ? idx : -1))
-                .filter(idx => idx !== -1)
+            const members = clusterMembers[c]
             if (members.length === 0) {
                 // Keep previous medoid if cluster is empty
                 newCenters.push(centers[c])
@@ -54,12 +54,19 @@ export interface ConfigMap {
     dbscan: DBSCANConfig
 }
 
+interface AutoClusteringOptions {
+    debug?: boolean // Whether autoCluster logs its automatic parameter search.
+}
+
 export type AutoConfigMap = {
     // Omit the required params, then make them optional
-    medoid: Omit<KModesConfig, 'k'> & { k?: number }
-    mean: Omit<KModesConfig, 'k'> & { k?: number }
-    hac: Omit<HACConfig, 'k'> & { k?: number }
-    dbscan: Omit<DBSCANConfig, 'eps' | 'minPts'> & { eps?: number; minPts?: number }
+    medoid: Omit<KModesConfig, 'k'> & { k?: number } & AutoClusteringOptions
+    mean: Omit<KModesConfig, 'k'> & { k?: number } & AutoClusteringOptions
+    hac: Omit<HACConfig, 'k'> & { k?: number } & AutoClusteringOptions
+    dbscan: Omit<DBSCANConfig, 'eps' | 'minPts'> & {
+        eps?: number
+        minPts?: number
+    } & AutoClusteringOptions
 }
 
 export type Mode = keyof ConfigMap
@@ -13,11 +13,9 @@ export function makeSelfChunks<T>(items: T[]): T[][] {
     if (items.length < MAX_ITEMS) {
         return [items]
     }
-    const chunks: T[][] = []
-    for (let i = 0; i < items.length; i += MAX_ITEMS) {
-        chunks.push(items.slice(i, i + MAX_ITEMS))
-    }
-    return chunks
+    return Array.from({ length: Math.ceil(items.length / MAX_ITEMS) }, (_, i) =>
+        items.slice(i * MAX_ITEMS, (i + 1) * MAX_ITEMS),
+    )
 }
 
 /**
@@ -33,49 +31,77 @@ export interface CrossBody<A, B> {
 }
 
 /**
- * Split two sets into chunked request bodies when combined size exceeds MAX_ITEMS.
+ * Lazily yield the chunked request bodies for a cross-comparison, in row-major chunk order.
  * Chooses to chunk only one side if the other is small, or both if both are large.
  */
-export function makeCrossBodies<A, B>(setA: A[], setB: B[], flatten: boolean): CrossBody<A, B>[] {
+export function* iterCrossBodies<A, B>(
+    setA: A[],
+    setB: B[],
+    flatten: boolean,
+): Generator<CrossBody<A, B>> {
     const total = setA.length + setB.length
     if (total <= MAX_ITEMS * 2) {
-        return [{ setA, setB, flatten }]
+        yield { setA, setB, flatten }
+        return
     }
     const chunksA = setA.length > MAX_ITEMS ? makeSelfChunks(setA) : [setA]
     const chunksB = setB.length > MAX_ITEMS ? makeSelfChunks(setB) : [setB]
-    const bodies: CrossBody<A, B>[] = []
     for (const a of chunksA) {
-        for (const b of chunksB) {
-            bodies.push({ setA: a, setB: b, flatten })
-        }
+        for (const b of chunksB) yield { setA: a, setB: b, flatten }
+    }
+}
+
+/**
+ * Split two sets into chunked request bodies when combined size exceeds MAX_ITEMS.
+ * Chooses to chunk only one side if the other is small, or both if both are large.
+ */
+export function makeCrossBodies<A, B>(setA: A[], setB: B[], flatten: boolean): CrossBody<A, B>[] {
+    return Array.from(iterCrossBodies(setA, setB, flatten))
+}
+
+/** Compute the starting offset of each chunk, plus the total length as the final entry. */
+function chunkOffsets<T>(chunks: T[][]): number[] {
+    const offsets: number[] = [0]
+    for (const c of chunks) offsets.push(offsets[offsets.length - 1] + c.length)
+    return offsets
+}
+
+/**
+ * Copy row `r` of each block in a row-strip into `row`, laying the blocks out side by side
+ * starting at column `c0`.
+ */
+function fillStripRow(row: number[], strip: number[][][], r: number, c0: number): void {
+    let c = c0
+    for (const block of strip) {
+        const src = block[r]
+        for (let k = 0; k < src.length; k++) row[c++] = src[k]
     }
-    return bodies
 }
 
 /**
  * Stitch together an array of partial similarity result matrices into one full matrix.
  * Supports both self-comparison (square symmetric) and cross-comparison.
+ *
+ * Results arrive as the upper-triangle blocks (i <= j) in row-major order. Each output row is
+ * allocated at full width and filled from the block rows of its row-strip; the columns left of
+ * the diagonal block are then mirrored from the rows already built above it.
  */
 function stitchSelf<A>(results: { matrix: number[][] }[], full: A[]): number[][] {
     const chunks = makeSelfChunks(full)
+    const nb = chunks.length
+    const offsets = chunkOffsets(chunks)
     const n = full.length
-    const matrix: number[][] = Array.from({ length: n }, () => Array(n).fill(0))
-    const offsets: number[] = [0]
-    for (const c of chunks) offsets.push(offsets[offsets.length - 1] + c.length)
+    const matrix: number[][] = new Array(n)
     let idx = 0
-    for (let i = 0; i < chunks.length; i++) {
-        for (let j = i; j < chunks.length; j++) {
-            const block = (results[idx++] as { matrix: number[][] }).matrix
-            const r0 = offsets[i]
-            const r1 = offsets[i + 1]
-            const c0 = offsets[j]
-            const c1 = offsets[j + 1]
-            for (let r = r0; r < r1; r++) {
-                for (let c = c0; c < c1; c++) {
-                    matrix[r][c] = block[r - r0]?.[c - c0]
-                    if (i !== j) matrix[c][r] = block[r - r0][c - c0]
-                }
-            }
+    for (let i = 0; i < nb; i++) {
+        const strip = results.slice(idx, idx + nb - i).map(r => r.matrix)
+        idx += nb - i
+        const r0 = offsets[i]
+        for (let r = r0; r < offsets[i + 1]; r++) {
+            const row: number[] = new Array(n)
+            for (let c = 0; c < r0; c++) row[c] = matrix[c][r]
+            fillStripRow(row, strip, r - r0, r0)
+            matrix[r] = row
         }
     }
     return matrix
@@ -83,32 +109,29 @@ function stitchSelf<A>(results: { matrix: number[][] }[], full: A[]): number[][]
 
 function stitchCross<A, B>(results: { matrix: number[][] }[], fullA: A[], fullB: B[]): number[][] {
     const chunksA = makeSelfChunks(fullA)
-    const chunksB = makeSelfChunks(fullB)
-    const matrix: number[][] = Array.from({ length: fullA.length }, () =>
-        Array(fullB.length).fill(0),
-    )
-    const offsetsA: number[] = [0]
-    for (const c of chunksA) offsetsA.push(offsetsA[offsetsA.length - 1] + c.length)
-    const offsetsB: number[] = [0]
-    for (const c of chunksB) offsetsB.push(offsetsB[offsetsB.length - 1] + c.length)
-    let idx = 0
+    const nb = makeSelfChunks(fullB).length
+    const offsetsA = chunkOffsets(chunksA)
+    const matrix: number[][] = new Array(fullA.length)
     for (let i = 0; i < chunksA.length; i++) {
-        for (let j = 0; j < chunksB.length; j++) {
-            const block = results[idx++].matrix
-            const r0 = offsetsA[i]
-            const r1 = offsetsA[i + 1]
-            const c0 = offsetsB[j]
-            const c1 = offsetsB[j + 1]
-            for (let r = r0; r < r1; r++) {
-                for (let c = c0; c < c1; c++) {
-                    matrix[r][c] = block[r - r0][c - c0]
-                }
-            }
+        const strip = results.slice(i * nb, (i + 1) * nb).map(r => r.matrix)
+        const r0 = offsetsA[i]
+        for (let r = r0; r < offsetsA[i + 1]; r++) {
+            const row: number[] = new Array(fullB.length)
+            fillStripRow(row, strip, r - r0, 0)
+            matrix[r] = row
         }
     }
     return matrix
 }
 
+/**
+ * Whether two item sets describe a self-comparison: the same array, or element-wise equal.
+ */
+function isSelfComparison<A>(fullA: A[], fullB: A[]): boolean {
+    if (fullA === fullB) return true
+    return fullA.length === fullB.length && fullA.every((a, ia) => fullB[ia] === a)
+}
+
 /**
  * Stitch together partial similarity result matrices into a full matrix.
  *
@@ -124,7 +147,7 @@ export function stitchResults<A>(
     fullA: A[],
     fullB: A[],
 ): number[][] {
-    return fullA.every((a, ia) => fullB[ia] === a)
+    return isSelfComparison(fullA, fullB)
         ? stitchSelf(results, fullA)
         : stitchCross(results, fullA, fullB)
 }
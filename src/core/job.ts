@@ -2,6 +2,7 @@ import { fetchWithRetry, type FetchOptions } from '../http'
 import { PulseAPIError } from '../errors'
 import type { Auth } from '../auth'
 import { debugLog } from './log'
+import { sleep } from './sleep'
 
 /** @internal */
 export interface JobInfo<T, After = T> {
@@ -106,7 +107,7 @@ export class Job<T, After = T> {
                 this.debug,
                 `[Job ${this.jobId}] pending; waiting ${this.pollIntervalMs}ms before retry`,
             )
-            await new Promise(resolve => setTimeout(resolve, this.pollIntervalMs))
+            await sleep(this.pollIntervalMs)
         }
     }
 }
@@ -0,0 +1,10 @@
+/**
+ * Resolve after the given number of milliseconds.
+ *
+ * Lives in its own module so tests can replace it when replaying recorded job polling.
+ *
+ * @param ms - Delay in milliseconds.
+ */
+export function sleep(ms: number): Promise<void> {
+    return new Promise(resolve => setTimeout(resolve, ms))
+}
@@ -1,9 +1,36 @@
+import type { SimilarityResponse } from '../core/clients/compareSimilarity'
 import { ClusterResult } from '../results'
 import { staticImplements, type ContextBase, type Process, type ProcessStatic } from './types'
 
 // Internal helper type for DSL inputs metadata
 type ProcWithInputs = { _inputs?: string[] }
 
+/**
+ * Full square similarity matrix for a self-comparison response.
+ *
+ * The API returns self-similarity as the row-major upper triangle without the diagonal, so the
+ * matrix is rebuilt from `flattened` by mirroring each value and filling the diagonal with 1.
+ */
+function selfSimilarityMatrix(resp: SimilarityResponse): number[][] {
+    if (resp.matrix) return resp.matrix
+    if (resp.scenario !== 'self' || resp.mode !== 'flattened') {
+        throw new Error(
+            `Cluster: cannot read a ${resp.scenario}/${resp.mode} response as self-similarity`,
+        )
+    }
+    const { flattened, n } = resp
+    const matrix: number[][] = Array.from({ length: n }, () => new Array(n))
+    let k = 0
+    for (let i = 0; i < n; i++) {
+        matrix[i][i] = 1
+        for (let j = i + 1; j < n; j++) {
+            matrix[i][j] = flattened[k]
+            matrix[j][i] = flattened[k++]
+        }
+    }
+    return matrix
+}
+
 /**
  * Process that clusters a dataset by computing pairwise similarity among items.
  *
@@ -45,8 +72,11 @@ export class Cluster<Name extends string = 'cluster'> implements Process<Name, C
         const arr = ctx.datasets[inp]
         const texts: string[] = Array.isArray(arr) ? arr : [arr]
         const fastFlag = this.fast ?? ctx.fast
-        await ctx.client.compareSimilarity({ set: texts }, { fast: fastFlag, awaitJobResult: true })
+        const resp = await ctx.client.compareSimilarity(
+            { set: texts },
+            { fast: fastFlag, awaitJobResult: true },
+        )
 
-        return new ClusterResult([], texts)
+        return new ClusterResult(selfSimilarityMatrix(resp), texts)
     }
 }
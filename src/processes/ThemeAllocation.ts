@@ -115,20 +115,20 @@ export class ThemeAllocation<Name extends string = 'themeAllocation'>
         const inp = (this as unknown as ProcWithInputs)._inputs?.[0] ?? 'dataset'
         const arr = ctx.datasets[inp]
         const texts: string[] = Array.isArray(arr) ? arr : [arr]
-        const labels = this.themeLabels(ctx)
-        const simTexts = this.themeRepresentatives(ctx)
+        const { labels, representatives: simTexts } = this.themeLabelsAndRepresentatives(ctx)
         const fastFlag = this.fast ?? ctx.fast
         const resp = await ctx.client.compareSimilarity(
             { setA: texts, setB: simTexts },
             { fast: fastFlag },
         )
         const simMatrix: number[][] = resp.matrix!
-        const assignments = simMatrix.map(row =>
-            row.reduce(
-                (bestIdx, _, i) => ((row[i] as number) > (row[bestIdx] as number) ? i : bestIdx),
-                0,
-            ),
-        )
+        const assignments = simMatrix.map(row => {
+            let bestIdx = 0
+            for (let i = 1; i < row.length; i++) {
+                if (row[i] > row[bestIdx]) bestIdx = i
+            }
+            return bestIdx
+        })
 
         return new ThemeAllocationResult(
             texts,
@@ -1,6 +1,6 @@
 import type { components } from '../models'
 import { ThemeGenerationResult } from '../results/ThemeGenerationResult'
-import { shuffle } from './shuffle'
+import { sample } from './shuffle'
 import { staticImplements, type ContextBase, type Process, type ProcessStatic } from './types'
 
 // Internal helper for DSL-provided inputs metadata
@@ -61,7 +61,7 @@ type Theme = components['schemas']['Theme']
  * @see {@link ContextBase} for the context in which the process runs.
  * @see {@link Process} for the base process interface.
  * @see {@link ProcessStatic} for the static interface of a process.
- * @see {@link shuffle} for the utility function used to randomize input texts.
+ * @see {@link sample} for the utility function used to randomly subsample input texts.
  */
 @staticImplements<ProcessStatic<'themeGeneration', ThemeGenerationResult>>()
 export class ThemeGeneration<Name extends string = 'themeGeneration'>
@@ -167,7 +167,7 @@ export class ThemeGeneration<Name extends string = 'themeGeneration'>
         const fastFlag = this.fast ?? ctx.fast
         const sampleSize = fastFlag ? 200 : 1000
         if (texts.length > sampleSize) {
-            texts = shuffle(texts).slice(0, sampleSize)
+            texts = sample(texts, sampleSize)
         }
         const response = await ctx.client.generateThemes(texts, {
             minThemes: this.minThemes,
@@ -210,9 +210,9 @@ export class ThemeGeneration<Name extends string = 'themeGeneration'>
  * Returns an array of theme labels, either from the provided themes or from the previous
  * theme generation results.
  *
- * @method themeRepresentatives
- * Returns an array of theme representatives, either from the provided themes or from the
- * previous theme generation results.
+ * @method themeLabelsAndRepresentatives
+ * Returns the theme labels together with their representative texts, resolving the themes
+ * once, either from the provided themes or from the previous theme generation results.
  *
  * @method getThemes
  * Retrieves the list of themes to use, either from the `themes` property or from the
@@ -257,14 +257,25 @@ export abstract class ThemeGenerationDependent {
         }
     }
 
-    protected themeRepresentatives(ctx: ContextBase): string[] {
+    /**
+     * Resolve the themes once and derive both their labels and their representative texts.
+     */
+    protected themeLabelsAndRepresentatives(ctx: ContextBase): {
+        labels: string[]
+        representatives: string[]
+    } {
         const themes = this.getThemes(ctx)
 
         if (typeof themes[0] === 'string') {
-            return themes as string[]
-        } else {
-            return (themes as Theme[]).map(t => t.representatives.join('\n'))
+            return { labels: themes as string[], representatives: themes as string[] }
+        }
+        const labels: string[] = []
+        const representatives: string[] = []
+        for (const t of themes as Theme[]) {
+            labels.push(t.shortLabel ?? t.label)
+            representatives.push(t.representatives.join('\n'))
         }
+        return { labels, representatives }
     }
 
     private getThemes(ctx: ContextBase): Theme[] | string[] {
@@ -16,3 +16,27 @@ export function shuffle<T>(arr: T[]): T[] {
     }
     return a
 }
+
+/**
+ * Randomly draws `k` distinct elements from an array without mutating the original.
+ *
+ * Runs only the first `k` steps of a Fisher–Yates shuffle, so the cost is proportional to the
+ * sample size rather than the array length once the copy is made. Each `k`-subset, in each
+ * order, is equally likely.
+ *
+ * @typeParam T - The type of elements contained in the array.
+ * @param arr - The array to sample from.
+ * @param k - Number of elements to draw. Fractions are rounded down, negative values give an
+ *   empty sample, and values above `arr.length` return a full shuffle.
+ * @returns A new array of `min(k, arr.length)` randomly chosen elements.
+ */
+export function sample<T>(arr: T[], k: number): T[] {
+    const a = [...arr]
+    const n = Math.max(0, Math.min(Math.floor(k), a.length))
+    for (let i = 0; i < n; i++) {
+        const j = i + Math.floor(Math.random() * (a.length - i))
+        ;[a[i] as unknown, a[j] as unknown] = [a[j], a[i]]
+    }
+    a.length = n
+    return a
+}
@@ -356,26 +356,35 @@ export class DataDictionaryResult {
      * @returns An object containing counts and breakdowns of variables by type and scale level.
      */
     getSummary() {
+        const variables = this.getVariables()
+        const variablesByType: Record<DDIVariable['type'], number> = {
+            string: 0,
+            numeric: 0,
+            date: 0,
+            boolean: 0,
+            text: 0,
+        }
+        const variablesByScale: Record<DDIVariable['scaleLevel'], number> = {
+            nominal: 0,
+            ordinal: 0,
+            interval: 0,
+            ratio: 0,
+        }
+        // Tally both breakdowns in one pass instead of filtering the variables once per bucket
+        for (const { scaleLevel, type } of variables) {
+            if (variablesByType[type] !== undefined) variablesByType[type]++
+            if (variablesByScale[scaleLevel] !== undefined) variablesByScale[scaleLevel]++
+        }
+
         return {
             title: this.title,
             description: this.description,
-            totalVariables: this.getVariables().length,
+            totalVariables: variables.length,
             totalValueDomains: this.getValueDomains().length,
             totalCategories: this.getCategories().length,
             qualityMetrics: this.qualityMetrics,
-            variablesByType: {
-                string: this.getVariablesByType('string').length,
-                numeric: this.getVariablesByType('numeric').length,
-                date: this.getVariablesByType('date').length,
-                boolean: this.getVariablesByType('boolean').length,
-                text: this.getVariablesByType('text').length,
-            },
-            variablesByScale: {
-                nominal: this.getVariablesByScaleLevel('nominal').length,
-                ordinal: this.getVariablesByScaleLevel('ordinal').length,
-                interval: this.getVariablesByScaleLevel('interval').length,
-                ratio: this.getVariablesByScaleLevel('ratio').length,
-            },
+            variablesByType,
+            variablesByScale,
         }
     }
 }
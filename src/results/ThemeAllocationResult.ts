@@ -2,6 +2,28 @@
  * Results of theme allocation with helper methods.
  */
 
+/**
+ * Indices of the `k` largest values in `row`, highest first; ties keep the earlier index first.
+ *
+ * For small `k`, keeps a sorted buffer of at most `k` candidates, so a row costs O(m·k) rather
+ * than sorting all `m` scores. When every index is wanted, a plain (stable) sort is cheaper.
+ */
+function topIndices(row: number[], k: number): number[] {
+    if (k >= row.length) {
+        return row.map((_, idx) => idx).sort((a, b) => row[b] - row[a])
+    }
+    const top: number[] = []
+    for (let idx = 0; idx < row.length; idx++) {
+        const val = row[idx]
+        if (top.length >= k && !(val > row[top[top.length - 1]])) continue
+        let pos = top.length
+        while (pos > 0 && val > row[top[pos - 1]]) pos--
+        top.splice(pos, 0, idx)
+        if (top.length > k) top.pop()
+    }
+    return top
+}
+
 export class ThemeAllocationResult {
     private themesArr: string[]
     constructor(
@@ -33,13 +55,12 @@ export class ThemeAllocationResult {
         const thr = threshold ?? this.threshold
         const result: Record<string, string | null> = {}
         this.similarity.forEach((row, i) => {
-            const bestIdx = row.reduce(
-                (best, _, j) => ((row[j] as number) > (row[best] as number) ? j : best),
-                0,
-            )
-            const bestVal = row[bestIdx] as number
+            let bestIdx = 0
+            for (let j = 1; j < row.length; j++) {
+                if (row[j] > row[bestIdx]) bestIdx = j
+            }
             result[this.texts[i] as string] =
-                bestVal >= thr ? (this.themesArr[bestIdx] ?? null) : null
+                row[bestIdx] >= thr ? (this.themesArr[bestIdx] ?? null) : null
         })
         return result
     }
@@ -53,12 +74,8 @@ export class ThemeAllocationResult {
     assignMulti(k?: number): Array<Record<string, string>> {
         const topK = k ?? this.themesArr.length
         return this.similarity.map(row => {
-            const sorted = row
-                .map((val, idx) => [idx, val] as [number, number])
-                .sort((a, b) => b[1] - a[1])
-                .slice(0, topK)
             const entry: Record<string, string> = {}
-            sorted.forEach(([idx], j) => {
+            topIndices(row, topK).forEach((idx, j) => {
                 entry[`theme_${j + 1}`] = this.themesArr[idx] as string
             })
             return entry
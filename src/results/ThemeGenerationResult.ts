@@ -26,12 +26,12 @@ export class ThemeGenerationResult {
         representative_1: string
         representative_2?: string
     }> {
-        return this.response.themes.map(theme => ({
-            shortLabel: theme.shortLabel,
-            label: theme.label,
-            description: theme.description,
-            representative_1: theme.representatives[0] ?? '',
-            representative_2: theme.representatives[1],
+        return this.response.themes.map(({ description, label, representatives, shortLabel }) => ({
+            shortLabel,
+            label,
+            description,
+            representative_1: representatives[0] ?? '',
+            representative_2: representatives[1],
         }))
     }
 }
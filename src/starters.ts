@@ -15,6 +15,16 @@ import { DataDictionaryResult } from './results/DataDictionaryResult'
 import { processes } from './processes/types'
 import type { components } from './models'
 
+/** Split file contents into trimmed, non-empty lines in a single pass. */
+function nonEmptyLines(raw: string): string[] {
+    const out: string[] = []
+    for (const line of raw.split(/\r?\n/)) {
+        const trimmed = line.trim()
+        if (trimmed) out.push(trimmed)
+    }
+    return out
+}
+
 export function getStrings(source: string[] | string): string[] {
     if (Array.isArray(source)) {
         return source
@@ -23,17 +33,18 @@ export function getStrings(source: string[] | string): string[] {
         const ext = path.extname(source).toLowerCase()
         const raw = fs.readFileSync(source, 'utf-8')
         if (ext === '.txt') {
-            return raw
-                .split(/\r?\n/)
-                .map(l => l.trim())
-                .filter(Boolean)
+            return nonEmptyLines(raw)
         }
         if (ext === '.csv' || ext === '.tsv') {
             const sep = ext === '.csv' ? ',' : '\t'
-            return raw
-                .split(/\r?\n/)
-                .map(line => line.split(sep)[0])
-                .filter(Boolean)
+            // Only the first column is needed, so stop each line at its first separator
+            const out: string[] = []
+            for (const line of raw.split(/\r?\n/)) {
+                const end = line.indexOf(sep)
+                const first = end === -1 ? line : line.slice(0, end)
+                if (first) out.push(first)
+            }
+            return out
         }
     }
     throw new Error('Provide a list of strings or a valid .txt, .csv, or .tsv file path')
@@ -63,10 +74,7 @@ function getThemes(themes: ThemesInput | undefined): Theme[] | string[] | undefi
         const ext = path.extname(themes).toLowerCase()
         const raw = fs.readFileSync(themes, 'utf-8')
         if (ext === '.txt') {
-            return raw
-                .split(/\r?\n/)
-                .map(l => l.trim())
-                .filter(Boolean)
+            return nonEmptyLines(raw)
         }
         if (ext === '.csv' || ext === '.tsv') {
             const sep = ext === '.csv' ? ',' : '\t'
@@ -5,28 +5,18 @@ import { ThemeAllocationResult } from '../src/results/ThemeAllocationResult'
 import { SentimentResult } from '../src/results/SentimentResult'
 import { ThemeGenerationResult } from '../src/results/ThemeGenerationResult'
 import { DataDictionaryResult } from '../src/results/DataDictionaryResult'
-import { CoreClient } from '../src/core/clients/CoreClient'
-import { ClientCredentialsAuth } from '../src/auth/ClientCredentialsAuth'
 import { ThemeGeneration } from '../src/processes/ThemeGeneration'
 import { Sentiment } from '../src/processes/Sentiment'
 import { ThemeAllocation } from '../src/processes/ThemeAllocation'
 import { GenerateDataDictionary } from '../src/processes/GenerateDataDictionary'
 import { processes } from '../src/processes/types'
 import { smallDataset, mixedDataset } from './fixtures/dataDictionaryFixtures'
+import { getTestClient, hasTestCredentials } from './setupClient'
 
-const clientId = process.env.PULSE_CLIENT_ID
-const clientSecret = process.env.PULSE_CLIENT_SECRET
-const tokenUrl = process.env.PULSE_TOKEN_URL
-const baseUrl = process.env.PULSE_BASE_URL
-if (!clientId || !clientSecret || !tokenUrl || !baseUrl) {
+if (!hasTestCredentials()) {
     describe.skip('Analyzer and processes (requires credentials)', () => {})
 } else {
-    const auth = new ClientCredentialsAuth({
-        clientId,
-        clientSecret,
-        tokenUrl,
-    })
-    const client = new CoreClient({ baseUrl: baseUrl as string, auth })
+    const client = getTestClient()
 
     describe('Analyzer without processes', () => {
         setupPolly()
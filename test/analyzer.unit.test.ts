@@ -6,13 +6,16 @@ import { ThemeExtraction } from '../src/processes/ThemeExtraction'
 import type { Process, ContextBase } from '../src/processes/types'
 import type { CoreClient } from '../src/core/clients/CoreClient'
 
+// None of these tests reach the API, so they can all share one placeholder client.
+const client = {} as CoreClient
+
 describe('Analyzer resolveDependencies', () => {
     it('injects ThemeGeneration when ThemeAllocation without themes provided', () => {
         const alloc = new ThemeAllocation()
         const analyzer = new Analyzer({
             datasets: { dataset: [] },
             processes: [alloc],
-            client: {} as CoreClient,
+            client,
         })
         expect(analyzer.processes[0]).toBeInstanceOf(ThemeGeneration)
         expect(analyzer.processes[1]).toBe(alloc)
@@ -24,7 +27,7 @@ describe('Analyzer resolveDependencies', () => {
         const analyzer = new Analyzer({
             datasets: { dataset: [] },
             processes: [alloc, extract],
-            client: {} as CoreClient,
+            client,
         })
         const gens = analyzer.processes.filter(p => p instanceof ThemeGeneration)
         expect(gens).toHaveLength(1)
@@ -45,7 +48,7 @@ describe('Analyzer resolveDependencies', () => {
                 new Analyzer({
                     datasets: { dataset: [] },
                     processes: [new Dummy()],
-                    client: {} as CoreClient,
+                    client,
                 }),
         ).toThrowError("Missing dependency process 'missing'")
     })
@@ -72,7 +75,7 @@ describe('Analyzer run and AnalysisResult', () => {
         const analyzer = new Analyzer({
             datasets: { dataset: [] },
             processes: [new P1(), new P2()],
-            client: {} as CoreClient,
+            client,
         })
         const res = await analyzer.run()
         expect(res.p1).toBe(1)
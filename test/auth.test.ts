@@ -55,6 +55,30 @@ describe('ClientCredentialsAuth', () => {
         const { value: out } = await gen.next()
         expect(out.headers.get('Authorization')).toBe('Bearer tok')
     })
+
+    it('shares one token request between concurrent callers', async () => {
+        const fakeResp = {
+            ok: true,
+            status: 200,
+            json: async () => ({ access_token: 'tok', expires_in: 600 }),
+        }
+        const fetchMock = vi.fn().mockResolvedValue(fakeResp)
+        vi.stubGlobal('fetch', fetchMock)
+        const auth = new ClientCredentialsAuth({
+            tokenUrl: 'url',
+            clientId: 'id',
+            clientSecret: 'sec',
+        })
+        const outs = await Promise.all(
+            [1, 2, 3].map(async i => {
+                const { value } = await auth.authFlow(new Request(`http://api/${i}`)).next()
+                return value
+            }),
+        )
+        await auth.prefetchToken()
+        expect(fetchMock).toHaveBeenCalledTimes(1)
+        for (const out of outs) expect(out.headers.get('Authorization')).toBe('Bearer tok')
+    })
 })
 
 describe('AuthorizationCodePKCEAuth', () => {
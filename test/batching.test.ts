@@ -1,5 +1,11 @@
 import { describe, it, expect } from 'vitest'
-import { makeSelfChunks, makeCrossBodies, stitchResults, MAX_ITEMS } from '../src/core/batching'
+import {
+    makeSelfChunks,
+    makeCrossBodies,
+    iterCrossBodies,
+    stitchResults,
+    MAX_ITEMS,
+} from '../src/core/batching'
 
 describe('makeSelfChunks', () => {
     it('returns a single chunk when length <= MAX_ITEMS', () => {
@@ -43,18 +49,15 @@ describe('makeCrossBodies', () => {
         const sizeB = MAX_ITEMS * 2
         const setA = Array.from({ length: sizeA }, (_, i) => i)
         const setB = Array.from({ length: sizeB }, (_, i) => i)
-        const bodies = makeCrossBodies(setA, setB, true)
-
-        expect(bodies.length).toBe(4)
 
-        expect(bodies[0]?.setA.length).toBeLessThanOrEqual(MAX_ITEMS)
-        expect(bodies[0]?.setB.length).toBeLessThanOrEqual(MAX_ITEMS)
-        expect(bodies[1]?.setA.length).toBeLessThanOrEqual(MAX_ITEMS)
-        expect(bodies[1]?.setB.length).toBeLessThanOrEqual(MAX_ITEMS)
-        expect(bodies[2]?.setA.length).toBeLessThanOrEqual(MAX_ITEMS)
-        expect(bodies[2]?.setB.length).toBeLessThanOrEqual(MAX_ITEMS)
-        expect(bodies[3]?.setA.length).toBeLessThanOrEqual(MAX_ITEMS)
-        expect(bodies[3]?.setB.length).toBeLessThanOrEqual(MAX_ITEMS)
+        let count = 0
+        for (const body of iterCrossBodies(setA, setB, true)) {
+            expect(body.setA.length).toBeLessThanOrEqual(MAX_ITEMS)
+            expect(body.setB.length).toBeLessThanOrEqual(MAX_ITEMS)
+            count++
+        }
+        expect(count).toBe(4)
+        expect(makeCrossBodies(setA, setB, true)).toHaveLength(count)
     })
 })
 
@@ -80,4 +83,47 @@ describe('stitchResults', () => {
         const result = stitchResults([{ matrix: block }], [], fullA, fullB)
         expect(result).toEqual(block)
     })
+
+    it('treats a set compared against a longer set with the same prefix as cross', () => {
+        const fullA = [0, 1]
+        const fullB = [0, 1, 2]
+        const block = [
+            [10, 11, 12],
+            [20, 21, 22],
+        ]
+        const result = stitchResults([{ matrix: block }], [], fullA, fullB)
+        expect(result).toEqual(block)
+    })
+})
+
+describe('stitchResults across multiple chunks', () => {
+    // stitchResults only reads block rows, so every row can share one array.
+    const block = (rows: number, cols: number, val: number): number[][] =>
+        Array(rows).fill(Array(cols).fill(val))
+
+    it('mirrors off-diagonal blocks for a chunked self-comparison', () => {
+        const full = Array.from({ length: MAX_ITEMS + 1 }, (_, i) => i)
+        const results = [
+            { matrix: block(MAX_ITEMS, MAX_ITEMS, 0) },
+            { matrix: block(MAX_ITEMS, 1, 1) },
+            { matrix: block(1, 1, 11) },
+        ]
+        const result = stitchResults(results, [], full, full)
+        expect(result).toHaveLength(MAX_ITEMS + 1)
+        expect(result[MAX_ITEMS]).toHaveLength(MAX_ITEMS + 1)
+        expect(result[0]?.[0]).toBe(0)
+        expect(result[0]?.[MAX_ITEMS]).toBe(1)
+        expect(result[MAX_ITEMS]?.[0]).toBe(1)
+        expect(result[MAX_ITEMS]?.[MAX_ITEMS]).toBe(11)
+    })
+
+    it('concatenates row strips for a chunked cross-comparison', () => {
+        const fullA = Array.from({ length: MAX_ITEMS + 1 }, (_, i) => `a${i}`)
+        const fullB = ['b0', 'b1', 'b2']
+        const results = [{ matrix: block(MAX_ITEMS, 3, 0) }, { matrix: block(1, 3, 10) }]
+        const result = stitchResults(results, [], fullA, fullB)
+        expect(result).toHaveLength(MAX_ITEMS + 1)
+        expect(result[0]).toEqual([0, 0, 0])
+        expect(result[MAX_ITEMS]).toEqual([10, 10, 10])
+    })
 })
@@ -1,9 +1,9 @@
 import { describe, it, expect, beforeAll } from 'vitest'
 import { CoreClient } from '../src/core/clients/CoreClient'
-import { Auth } from '../src/auth'
 import { setupPolly } from './setupPolly'
+import { getTestClient, hasTestCredentials } from './setupClient'
 
-const skip = !process.env.PULSE_CLIENT_SECRET || true
+const skip = !hasTestCredentials() || true
 
 describe('CoreClient clusterTexts and generateSummary integration', { skip }, () => {
     setupPolly()
@@ -11,15 +11,7 @@ describe('CoreClient clusterTexts and generateSummary integration', { skip }, ()
     let client: CoreClient
 
     beforeAll(() => {
-        client = new CoreClient({
-            baseUrl: process.env.PULSE_BASE_URL ?? 'https://staging.pulse.researchwiseai.com/v1',
-            auth: new Auth.ClientCredentialsAuth({
-                clientId: process.env.PULSE_CLIENT_ID ?? '',
-                clientSecret: process.env.PULSE_CLIENT_SECRET ?? '',
-                tokenUrl: process.env.PULSE_TOKEN_URL ?? '',
-                audience: process.env.PULSE_AUDIENCE ?? '',
-            }),
-        })
+        client = getTestClient()
     })
 
     it('clusterTexts returns clusters when fast', async () => {
@@ -3,25 +3,14 @@ import { CoreClient } from '../src/core/clients/CoreClient'
 import * as http from '../src/http'
 import { PulseAPIError, TimeoutError } from '../src/errors'
 import { setupPolly } from './setupPolly'
-import { Auth } from '../src/auth'
-
-const dummyAuth: Auth.Auth = {
-    authFlow: async function* (req: Request) {
-        yield req
-        return req
-    },
-    _refreshToken: () => Promise.resolve(),
-    refreshToken: '',
-    accessToken: '',
-    expiresAt: 0,
-}
+import { getTestClient, hasTestCredentials, noopAuth } from './setupClient'
 
 describe('CoreClient', () => {
     const baseUrl = 'http://api'
     let client: CoreClient
 
     beforeEach(() => {
-        client = new CoreClient({ baseUrl, auth: dummyAuth })
+        client = new CoreClient({ baseUrl, auth: noopAuth })
         vi.restoreAllMocks()
     })
 
@@ -313,21 +302,13 @@ describe('CoreClient', () => {
     })
 })
 
-describe('integration tests', { skip: !process.env.PULSE_CLIENT_SECRET }, () => {
+describe('integration tests', { skip: !hasTestCredentials() }, () => {
     setupPolly()
 
     let client: CoreClient
 
     beforeAll(() => {
-        client = new CoreClient({
-            baseUrl: process.env.PULSE_BASE_URL ?? 'https://staging.pulse.researchwiseai.com/v1',
-            auth: new Auth.ClientCredentialsAuth({
-                clientId: process.env.PULSE_CLIENT_ID ?? '',
-                clientSecret: process.env.PULSE_CLIENT_SECRET ?? '',
-                tokenUrl: process.env.PULSE_TOKEN_URL ?? '',
-                audience: process.env.PULSE_AUDIENCE ?? '',
-            }),
-        })
+        client = getTestClient()
     })
 
     it('createEmbeddings returns data', async () => {
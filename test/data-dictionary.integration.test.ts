@@ -1,7 +1,6 @@
 import { describe, it, expect } from 'vitest'
 import { setupPolly } from './setupPolly'
-import { CoreClient } from '../src/core/clients/CoreClient'
-import { ClientCredentialsAuth } from '../src/auth/ClientCredentialsAuth'
+import { getTestClient, hasTestCredentials } from './setupClient'
 import { DataDictionaryResult } from '../src/results/DataDictionaryResult'
 import { Job } from '../src/core/job'
 import {
@@ -11,20 +10,10 @@ import {
     minimalDataset,
 } from './fixtures/dataDictionaryFixtures'
 
-const clientId = process.env.PULSE_CLIENT_ID
-const clientSecret = process.env.PULSE_CLIENT_SECRET
-const tokenUrl = process.env.PULSE_TOKEN_URL
-const baseUrl = process.env.PULSE_BASE_URL
-
-if (!clientId || !clientSecret || !tokenUrl || !baseUrl) {
+if (!hasTestCredentials()) {
     describe.skip('Data Dictionary Integration (requires credentials)', () => {})
 } else {
-    const auth = new ClientCredentialsAuth({
-        clientId,
-        clientSecret,
-        tokenUrl,
-    })
-    const client = new CoreClient({ baseUrl: baseUrl as string, auth })
+    const client = getTestClient()
 
     describe('Data Dictionary Generation - End-to-End', () => {
         setupPolly()
@@ -48,32 +48,19 @@ export const mixedDataset: string[][] = [
  */
 export function generateLargeDataset(rows: number, cols: number): string[][] {
     const headers = Array.from({ length: cols }, (_, i) => `Column${i + 1}`)
-    const data: string[][] = [headers]
+    // Column suffixes are the same for every row, so build them once
+    const suffixes = Array.from({ length: cols }, (_, j) => `_${j}`)
+    const data: string[][] = new Array(rows + 1)
+    data[0] = headers
 
     for (let i = 0; i < rows; i++) {
-        const row = Array.from({ length: cols }, (_, j) => `Value${i}_${j}`)
-        data.push(row)
+        const prefix = `Value${i}`
+        data[i + 1] = suffixes.map(suffix => prefix + suffix)
     }
 
     return data
 }
 
-/**
- * Dataset that exceeds column limit (1,000 columns)
- */
-export const datasetExceedingColumnLimit = generateLargeDataset(5, 1001)
-
-/**
- * Dataset that exceeds row limit (50,000 rows)
- */
-export const datasetExceedingRowLimit = generateLargeDataset(50001, 5)
-
-/**
- * Dataset that exceeds total cell limit (100,000 cells)
- * 500 rows × 201 columns = 100,500 cells
- */
-export const datasetExceedingCellLimit = generateLargeDataset(500, 201)
-
 /**
  * Minimal valid dataset (2 rows including header)
  */
@@ -1,9 +1,6 @@
 import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest'
 import { fetchWithRetry } from '../src/http'
 import { TimeoutError, NetworkError } from '../src/errors'
-import { setupPolly } from './setupPolly'
-
-setupPolly()
 
 describe('fetchWithRetry happy path', () => {
     it('returns response on first attempt when ok', async () => {
@@ -1,20 +1,10 @@
 import { describe, it, expect, vi } from 'vitest'
 import { Job } from '../src/core/job'
 import * as http from '../src/http'
-import type { Auth } from '../src/auth'
+import * as timing from '../src/core/sleep'
+import { noopAuth } from './setupClient'
 
 describe('Job.result', () => {
-    const dummyAuth: Auth.Auth = {
-        authFlow: async function* (req: Request) {
-            yield req
-            return req
-        },
-        _refreshToken: async () => {},
-        accessToken: 'dummyAccessToken',
-        refreshToken: undefined,
-        expiresAt: undefined,
-    }
-
     it('resolves with result when job completes immediately', async () => {
         const info = { status: 'completed', resultUrl: 'http://result' }
         const infoRes = { ok: true, status: 200, json: async () => info } as unknown as Response
@@ -29,7 +19,7 @@ describe('Job.result', () => {
         const job = new Job({
             jobId: 'id',
             baseUrl: 'http://base',
-            auth: dummyAuth,
+            auth: noopAuth,
             pollIntervalMs: 0,
         })
         const result = await job.result()
@@ -51,7 +41,7 @@ describe('Job.result', () => {
         const job = new Job({
             jobId: 'id',
             baseUrl: 'http://base',
-            auth: dummyAuth,
+            auth: noopAuth,
             pollIntervalMs: 0,
         })
         const result = await job.result()
@@ -69,7 +59,7 @@ describe('Job.result', () => {
         const job = new Job({
             jobId: 'failId',
             baseUrl: 'http://base',
-            auth: dummyAuth,
+            auth: noopAuth,
             pollIntervalMs: 0,
         })
         await expect(job.result()).rejects.toThrow('Job failId failed')
@@ -89,7 +79,7 @@ describe('Job.result', () => {
         const job = new Job({
             jobId: 'debug',
             baseUrl: 'http://base',
-            auth: dummyAuth,
+            auth: noopAuth,
             pollIntervalMs: 0,
             debug: true,
         })
@@ -98,4 +88,33 @@ describe('Job.result', () => {
         const req0 = spy.mock.calls[0][0] as Request
         expect(req0.headers.get('x-pulse-debug')).toBe('true')
     })
+
+    it('waits pollIntervalMs between status checks until the job completes', async () => {
+        const pending = {
+            ok: true,
+            status: 200,
+            json: async () => ({ status: 'pending' }),
+        } as unknown as Response
+        const done = {
+            ok: true,
+            status: 200,
+            json: async () => ({ status: 'completed', resultUrl: 'http://result' }),
+        } as unknown as Response
+        const resultRes = { ok: true, status: 200, json: async () => ({}) } as unknown as Response
+        const spy = vi.spyOn(http, 'fetchWithRetry')
+        spy.mockResolvedValueOnce(pending)
+            .mockResolvedValueOnce(done)
+            .mockResolvedValueOnce(resultRes)
+        const sleepSpy = vi.spyOn(timing, 'sleep').mockResolvedValue(undefined)
+        const job = new Job({
+            jobId: 'slow',
+            baseUrl: 'http://base',
+            auth: noopAuth,
+            pollIntervalMs: 250,
+        })
+        await job.result()
+        expect(sleepSpy).toHaveBeenCalledTimes(1)
+        expect(sleepSpy).toHaveBeenCalledWith(250)
+        sleepSpy.mockRestore()
+    })
 })
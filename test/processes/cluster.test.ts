@@ -0,0 +1,72 @@
+import { describe, it, expect, vi } from 'vitest'
+import { Cluster } from '../../src/processes/Cluster'
+import { ClusterResult } from '../../src/results'
+import type { ContextBase } from '../../src/processes/types'
+import type { CoreClient } from '../../src/core/clients/CoreClient'
+
+function contextReturning(response: Record<string, unknown>): ContextBase {
+    const client = {
+        compareSimilarity: vi.fn().mockResolvedValue(response),
+    } as unknown as CoreClient
+    return { datasets: { dataset: ['a', 'b', 'c'] }, client, fast: false, processes: [] }
+}
+
+describe('Cluster', () => {
+    describe('run', () => {
+        it('rebuilds the square matrix from a flattened self-similarity response', async () => {
+            const ctx = contextReturning({
+                scenario: 'self',
+                mode: 'flattened',
+                n: 3,
+                flattened: [0.1, 0.2, 0.3],
+                requestId: 'r',
+            })
+
+            const result = await new Cluster().run(ctx)
+
+            expect(result).toBeInstanceOf(ClusterResult)
+            expect(result.similarityMatrix).toEqual([
+                [1, 0.1, 0.2],
+                [0.1, 1, 0.3],
+                [0.2, 0.3, 1],
+            ])
+            expect(ctx.client.compareSimilarity).toHaveBeenCalledWith(
+                { set: ['a', 'b', 'c'] },
+                { fast: false, awaitJobResult: true },
+            )
+        })
+
+        it('returns the matrix as-is when the response includes one', async () => {
+            const matrix = [
+                [1, 0.5],
+                [0.5, 1],
+            ]
+            const ctx = contextReturning({
+                scenario: 'self',
+                mode: 'matrix',
+                n: 2,
+                flattened: [],
+                matrix,
+                requestId: 'r',
+            })
+
+            const result = await new Cluster().run(ctx)
+
+            expect(result.similarityMatrix).toBe(matrix)
+        })
+
+        it('rejects a response that is not a flattened self comparison', async () => {
+            const ctx = contextReturning({
+                scenario: 'cross',
+                mode: 'flattened',
+                n: 3,
+                flattened: [0.1, 0.2, 0.3],
+                requestId: 'r',
+            })
+
+            await expect(new Cluster().run(ctx)).rejects.toThrow(
+                'cannot read a cross/flattened response as self-similarity',
+            )
+        })
+    })
+})
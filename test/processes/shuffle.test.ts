@@ -1,5 +1,5 @@
 import { describe, it, expect, vi, afterEach } from 'vitest'
-import { shuffle } from '../../src/processes/shuffle'
+import { sample, shuffle } from '../../src/processes/shuffle'
 
 describe('shuffle', () => {
     afterEach(() => {
@@ -46,3 +46,44 @@ describe('shuffle', () => {
         expect(original).toEqual([1, 2, 3])
     })
 })
+
+describe('sample', () => {
+    afterEach(() => {
+        vi.restoreAllMocks()
+    })
+
+    it('returns k distinct elements from the input', () => {
+        const arr = Array.from({ length: 50 }, (_, i) => i)
+        const result = sample(arr, 10)
+        expect(result).toHaveLength(10)
+        expect(new Set(result).size).toBe(10)
+        expect(arr).toEqual(expect.arrayContaining(result))
+    })
+
+    it('returns a full permutation when k exceeds the length', () => {
+        const arr = ['a', 'b', 'c']
+        const result = sample(arr, 5)
+        expect(result).toHaveLength(3)
+        expect(result).toEqual(expect.arrayContaining(arr))
+    })
+
+    it('floors fractional k and treats negative k as an empty sample', () => {
+        const arr = [1, 2, 3, 4, 5]
+        expect(sample(arr, 2.7)).toHaveLength(2)
+        expect(sample(arr, -1)).toEqual([])
+    })
+
+    it('does not mutate the original array', () => {
+        const original = [1, 2, 3, 4, 5]
+        sample(original, 2)
+        expect(original).toEqual([1, 2, 3, 4, 5])
+    })
+
+    it('produces a deterministic sample when Math.random is mocked', () => {
+        // For arr = [1,2,3,4] and Math.random() always returning 0.5:
+        // i=0 -> j = 0 + floor(0.5 * 4) = 2 => swap positions 0 and 2: [3,2,1,4]
+        // i=1 -> j = 1 + floor(0.5 * 3) = 2 => swap positions 1 and 2: [3,1,2,4]
+        vi.spyOn(Math, 'random').mockReturnValue(0.5)
+        expect(sample([1, 2, 3, 4], 2)).toEqual([3, 1])
+    })
+})
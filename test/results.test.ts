@@ -75,6 +75,22 @@ describe('ThemeAllocationResult', () => {
             { theme_1: 'C', theme_2: 'A' },
         ])
     })
+
+    it('rejects a missing similarity matrix', () => {
+        for (const similarity of [undefined, null]) {
+            expect(
+                () =>
+                    new ThemeAllocationResult(
+                        ['d1'],
+                        ['A'],
+                        [0],
+                        true,
+                        0.5,
+                        similarity as unknown as number[][],
+                    ),
+            ).toThrow('Similarity matrix is required for ThemeAllocationResult')
+        }
+    })
 })
 
 describe('ClusterResult', () => {
@@ -0,0 +1,49 @@
+import { CoreClient } from '../src/core/clients/CoreClient'
+import { ClientCredentialsAuth } from '../src/auth/ClientCredentialsAuth'
+import type { Auth } from '../src/auth'
+
+/**
+ * Authenticator that passes requests through unchanged, for tests that never reach the API.
+ */
+export const noopAuth: Auth.Auth = {
+    authFlow: async function* (req: Request) {
+        yield req
+        return req
+    },
+    _refreshToken: async () => {},
+    accessToken: undefined,
+    refreshToken: undefined,
+    expiresAt: undefined,
+}
+
+let sharedClient: CoreClient | undefined
+
+/**
+ * Whether the environment provides the credentials required by integration tests.
+ */
+export function hasTestCredentials(): boolean {
+    return Boolean(
+        process.env.PULSE_CLIENT_ID &&
+            process.env.PULSE_CLIENT_SECRET &&
+            process.env.PULSE_TOKEN_URL &&
+            process.env.PULSE_BASE_URL,
+    )
+}
+
+/**
+ * Returns a CoreClient configured from the PULSE_* environment variables.
+ *
+ * The client and its authenticator are built once and reused, so tests share a single access
+ * token instead of each fetching their own.
+ */
+export function getTestClient(): CoreClient {
+    if (!sharedClient) {
+        const auth = new ClientCredentialsAuth({
+            clientId: process.env.PULSE_CLIENT_ID,
+            clientSecret: process.env.PULSE_CLIENT_SECRET,
+            tokenUrl: process.env.PULSE_TOKEN_URL,
+        })
+        sharedClient = new CoreClient({ baseUrl: process.env.PULSE_BASE_URL, auth })
+    }
+    return sharedClient
+}
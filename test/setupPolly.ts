@@ -6,6 +6,9 @@ import FetchAdapter from '@pollyjs/adapter-fetch'
 import FSPersister from '@pollyjs/persister-fs'
 import { beforeEach, afterEach } from 'vitest'
 
+/** Strings that could hold a JSON object or array; anything else is not worth parsing. */
+const JSON_CONTAINER = /^\s*[[{]/
+
 function scrubTokens(obj: unknown): void {
     if (Array.isArray(obj)) {
         obj.forEach(scrubTokens)
@@ -16,7 +19,7 @@ function scrubTokens(obj: unknown): void {
             if (typeof value === 'string') {
                 if (/token$/i.test(key) || key === 'authorization') {
                     ;(obj as Record<string, unknown>)[key] = '<redacted>'
-                } else {
+                } else if (JSON_CONTAINER.test(value)) {
                     try {
                         const parsed = JSON.parse(value)
                         scrubTokens(parsed)
@@ -32,6 +35,25 @@ function scrubTokens(obj: unknown): void {
     }
 }
 
+/** Headers that carry credentials or per-request noise and are never needed for replay. */
+const DROPPED_HEADERS =
+    /^(?:set-cookie|cookie|alt-svc|report-to|nel|cf-.*|x-amz.*|x-ratelimit-.*|x-auth0-.*|apigw-requestid)$/i
+
+/** Credential fields in form-encoded bodies, such as OAuth token requests. */
+const FORM_SECRETS = /(^|&)(client_id|client_secret|code|code_verifier|refresh_token)=[^&]*/g
+
+type HarHeader = { name: string; value: string }
+
+function filterHeaders(headers: HarHeader[]): HarHeader[] {
+    return headers
+        .filter(({ name }) => !DROPPED_HEADERS.test(name))
+        .map(header =>
+            header.name.toLowerCase() === 'authorization'
+                ? { ...header, value: 'Bearer <redacted>' }
+                : header,
+        )
+}
+
 // Register Polly adapters and persisters
 Polly.register(NodeHttpAdapter)
 Polly.register(FetchAdapter)
@@ -61,25 +83,14 @@ export function setupPolly(options?: Record<string, unknown>) {
             ...(options || {}),
         })
 
-        polly.server.any().on('beforePersist', (req, recording) => {
-            recording.request = {
-                ...req,
-                headers: {
-                    ...req.headers,
-                    ...(req.headers.authorization ? { authorization: 'Bearer <redacted>' } : {}),
-                },
-                requestArguments: {
-                    ...req.requestArguments,
-                    ...((req.requestArguments as { options: Record<string, unknown> }).options
-                        ? {
-                              options: {
-                                  ...(req.requestArguments as { options: Record<string, unknown> })
-                                      .options,
-                                  headers: {},
-                              },
-                          }
-                        : {}),
-                },
+        polly.server.any().on('beforePersist', (_req, recording) => {
+            recording.request.headers = filterHeaders(recording.request.headers)
+            recording.response.headers = filterHeaders(recording.response.headers)
+            if (recording.request.postData?.text) {
+                recording.request.postData.text = recording.request.postData.text.replace(
+                    FORM_SECRETS,
+                    '$1$2=<redacted>',
+                )
             }
 
             scrubTokens(recording.request)
@@ -12,8 +12,7 @@ import {
 import { ClusterResult } from '../src/results'
 import { ThemeAllocationResult } from '../src/results/ThemeAllocationResult'
 import { DataDictionaryResult } from '../src/results/DataDictionaryResult'
-import { CoreClient } from '../src/core/clients/CoreClient'
-import { ClientCredentialsAuth } from '../src/auth/ClientCredentialsAuth'
+import { getTestClient } from './setupClient'
 import { smallDataset, mixedDataset } from './fixtures/dataDictionaryFixtures'
 
 const clientId = process.env.PULSE_CLIENT_ID
@@ -36,7 +35,7 @@ describe('starters', { skip }, () => {
         setupPolly()
         it('allocates themes implicitly', { timeout: 30_000 }, async () => {
             const reviews = ['good', 'bad']
-            const res = await themeAllocation(reviews)
+            const res = await themeAllocation(reviews, { client: getTestClient() })
             expect(res).toBeInstanceOf(ThemeAllocationResult)
             const single = res.assignSingle()
             expect(Object.keys(single)).toHaveLength(reviews.length)
@@ -47,7 +46,7 @@ describe('starters', { skip }, () => {
         it('allocates themes explicitly', { timeout: 30_000 }, async () => {
             const reviews = ['good', 'bad']
             const themes = ['positive', 'negative']
-            const res = await themeAllocation(reviews, { themes })
+            const res = await themeAllocation(reviews, { themes, client: getTestClient() })
             expect(res).toBeInstanceOf(ThemeAllocationResult)
             const single = res.assignSingle()
             expect(Object.keys(single)).toHaveLength(reviews.length)
@@ -60,8 +59,12 @@ describe('starters', { skip }, () => {
         setupPolly()
         it('returns ClusterResult instance', async () => {
             const reviews = ['x', 'y']
-            const res = await clusterAnalysis(reviews)
+            const res = await clusterAnalysis(reviews, { client: getTestClient() })
             expect(res).toBeInstanceOf(ClusterResult)
+            expect(res.similarityMatrix).toEqual([
+                [1, 0.44007358],
+                [0.44007358, 1],
+            ])
         })
     })
 
@@ -69,7 +72,7 @@ describe('starters', { skip }, () => {
         setupPolly()
         it('returns a summary', async () => {
             const reviews = ['this is great']
-            const res = await summarize(reviews, 'what?')
+            const res = await summarize(reviews, 'what?', { client: getTestClient() })
             expect(res.summary).toBeTypeOf('string')
         })
     })
@@ -78,7 +81,7 @@ describe('starters', { skip }, () => {
         setupPolly()
         it('returns embeddings', async () => {
             const reviews = ['hello world']
-            const res = await createEmbeddings(reviews)
+            const res = await createEmbeddings(reviews, { client: getTestClient() })
             expect(Array.isArray(res.embeddings)).toBe(true)
         })
     })
@@ -87,7 +90,7 @@ describe('starters', { skip }, () => {
         setupPolly()
         it('returns flattened similarity matrix', async () => {
             const reviews = ['a', 'b']
-            const res = await compareSimilarity(reviews)
+            const res = await compareSimilarity(reviews, { client: getTestClient() })
             expect(Array.isArray(res.flattened)).toBe(true)
         })
     })
@@ -96,6 +99,7 @@ describe('starters', { skip }, () => {
         setupPolly()
 
         it('generates data dictionary with minimal parameters', { timeout: 60_000 }, async () => {
+            // Leaves out `client` so the starter's default CoreClient stays covered
             const result = await generateDataDictionary(smallDataset)
 
             expect(result).toBeInstanceOf(DataDictionaryResult)
@@ -112,6 +116,7 @@ describe('starters', { skip }, () => {
                     description: 'E-commerce product data',
                     context: 'Online retail store',
                     language: 'en',
+                    client: getTestClient(),
                 })
 
                 expect(result).toBeInstanceOf(DataDictionaryResult)
@@ -126,18 +131,8 @@ describe('starters', { skip }, () => {
         )
 
         it('generates data dictionary with custom client', { timeout: 60_000 }, async () => {
-            const auth = new ClientCredentialsAuth({
-                clientId: process.env.PULSE_CLIENT_ID!,
-                clientSecret: process.env.PULSE_CLIENT_SECRET!,
-                tokenUrl: process.env.PULSE_TOKEN_URL!,
-            })
-            const customClient = new CoreClient({
-                baseUrl: process.env.PULSE_BASE_URL!,
-                auth,
-            })
-
             const result = await generateDataDictionary(smallDataset, {
-                client: customClient,
+                client: getTestClient(),
                 title: 'Custom Client Test',
             })
 
@@ -148,6 +143,7 @@ describe('starters', { skip }, () => {
 
         it('returns DataDictionaryResult with helper methods', { timeout: 60_000 }, async () => {
             const result = await generateDataDictionary(mixedDataset, {
+                client: getTestClient(),
                 title: 'Helper Methods Test',
             })
 
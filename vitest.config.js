@@ -1,13 +1,26 @@
+import fs from 'fs'
+import { parse } from 'dotenv'
 import { defineConfig } from 'vitest/config'
 
+// Load test environment variables from .env.test if present. This runs once in the main
+// process and workers inherit the result, instead of a setup file re-reading it per test file.
+const envTestPath = '.env.test'
+if (fs.existsSync(envTestPath)) {
+    const missing = Object.entries(parse(fs.readFileSync(envTestPath))).filter(
+        ([key]) => !(key in process.env),
+    )
+    Object.assign(process.env, Object.fromEntries(missing))
+}
+
 export default defineConfig({
     test: {
         globals: true,
         environment: 'node',
-        // Load test environment variables from .env.test if present
-        setupFiles: './test/setupEnv.js',
         include: ['src/**/*.test.ts', 'test/**/*.test.ts'],
         reporters: ['default'],
+        // Undo vi.stubGlobal (the fake fetch in the auth and http tests) after every test, so
+        // stubs never leak into later tests that reuse the same worker.
+        unstubGlobals: true,
         coverage: {
             provider: 'v8',
             reporter: ['text', 'json', 'html', 'lcov'],